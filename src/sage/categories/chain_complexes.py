@@ -14,10 +14,15 @@ Category of chain complexes
 #                  http://www.gnu.org/licenses/
 #*****************************************************************************
 
+from weakref import WeakKeyDictionary
+
 from sage.categories.category_types import Category_module
-from sage.categories.commutative_additive_groups import CommutativeAdditiveGroups
 from sage.categories.functor import Functor
 from sage.misc.abstract_method import abstract_method
+from sage.misc.lazy_import import lazy_import
+
+lazy_import('sage.categories.commutative_additive_groups',
+            'CommutativeAdditiveGroups')
 
 
 #############################################################
@@ -222,19 +227,32 @@ class HomologyFunctor(Functor):
         codomain = CommutativeAdditiveGroups()
         super().__init__(domain, codomain)
         self._n = n
+        self._cache = WeakKeyDictionary()
 
     def _apply_functor(self, x):
         r"""
         Apply ``self`` to a chain complex.
 
+        The result is cached (with a weak reference on the chain
+        complex), so that the homology of each complex is computed
+        only once per functor.
+
         TESTS::
 
             sage: C = ChainComplex({0: matrix(ZZ, 2, 3, [3, 0, 0, 0, 0, 0])})           # needs sage.modules
             sage: H = HomologyFunctor(ChainComplexes(ZZ), 1)
             sage: H._apply_functor(C)                                                   # needs sage.modules
             Z x C3
+            sage: H._apply_functor(C) is H._apply_functor(C)                            # needs sage.modules
+            True
         """
-        return x.homology(self._n)
+        try:
+            return self._cache[x]
+        except KeyError:
+            pass
+        homology = x.homology(self._n)
+        self._cache[x] = homology
+        return homology
 
     def _apply_functor_to_morphism(self, f):
         r"""
@@ -260,9 +278,16 @@ class HomologyFunctor(Functor):
         domain = f.domain()
         codomain = f.codomain()
         lift = domain.lift_from_homology
+        if lift is NotImplemented:
+            raise NotImplementedError(f'{domain} does not implement '
+                                      'lift_from_homology')
         reduce = codomain.reduce_to_homology
-        apply_f_star = lambda x: reduce(f(lift(x)), self._n)
-        return SetMorphism(Hom(domain.homology(self._n),
-                               codomain.homology(self._n),
+
+        # bind everything needed per evaluation as locals of the closure
+        def apply_f_star(x, f=f, lift=lift, reduce=reduce, n=self._n):
+            return reduce(f(lift(x)), n)
+
+        return SetMorphism(Hom(self._apply_functor(domain),
+                               self._apply_functor(codomain),
                                CommutativeAdditiveGroups()),
                            apply_f_star)
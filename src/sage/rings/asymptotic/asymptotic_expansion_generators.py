@@ -79,10 +79,20 @@ Classes and Methods
 #                  https://www.gnu.org/licenses/
 # ****************************************************************************
 
+from sage.arith.misc import bernoulli
+from sage.arith.srange import srange
+from sage.misc.cachefunc import cached_function
+from sage.misc.lazy_import import lazy_import
 from sage.misc.superseded import experimental
 from sage.structure.sage_object import SageObject
 from sage.misc.defaults import series_precision
 
+lazy_import('sage.functions.log', 'exp')
+lazy_import('sage.symbolic.ring', 'SR')
+
+from .asymptotic_ring import AsymptoticRing
+from .misc import combine_exceptions
+
 
 class AsymptoticExpansionGenerators(SageObject):
     r"""
@@ -178,20 +188,8 @@ class AsymptoticExpansionGenerators(SageObject):
 
         if precision < 3:
             raise ValueError("precision must be at least 3")
-        log_Stirling = AsymptoticExpansionGenerators.log_Stirling(
-            var, precision=precision, skip_constant_summand=True)
-
-        P = log_Stirling.parent().change_parameter(
-            growth_group='(e^({n}*log({n})))^QQ * (e^{n})^QQ * {n}^QQ * log({n})^QQ'.format(n=var))
-        from sage.functions.log import exp
-        result = exp(P(log_Stirling))
 
-        if not skip_constant_factor:
-            from sage.symbolic.ring import SR
-            SCR = SR.subring(no_variables=True)
-            result *= (2*SCR('pi')).sqrt()
-
-        return result
+        return _Stirling_(var, precision, skip_constant_factor)
 
     @staticmethod
     def log_Stirling(var, precision=None, skip_constant_summand=False):
@@ -274,45 +272,10 @@ class AsymptoticExpansionGenerators(SageObject):
             m*log(m) - m + 1/2*log(m) + 1/12*m^(-1) - 1/360*m^(-3) +
             1/1260*m^(-5) + O(m^(-7))
         """
-        if not skip_constant_summand:
-            from sage.symbolic.ring import SR
-            coefficient_ring = SR.subring(no_variables=True)
-        else:
-            from sage.rings.rational_field import QQ
-            coefficient_ring = QQ
-
-        from .asymptotic_ring import AsymptoticRing
-        A = AsymptoticRing(growth_group='{n}^ZZ * log({n})^ZZ'.format(n=var),
-                           coefficient_ring=coefficient_ring)
-        n = A.gen()
-
         if precision is None:
             precision = series_precision()
 
-        log = A.locals()['log']
-        result = A.zero()
-        if precision >= 1:
-            result += n * log(n)
-        if precision >= 2:
-            result += -n
-        if precision >= 3:
-            result += log(n) / 2
-        if precision >= 4 and not skip_constant_summand:
-            result += log(2*coefficient_ring('pi')) / 2
-
-        result += AsymptoticExpansionGenerators._log_StirlingNegativePowers_(
-            var, precision - 4)
-
-        if precision < 1:
-            result += (n * log(n)).O()
-        elif precision == 1:
-            result += n.O()
-        elif precision == 2:
-            result += log(n).O()
-        elif precision == 3:
-            result += A(1).O()
-
-        return result
+        return _log_Stirling_(var, precision, skip_constant_summand)
 
     @staticmethod
     def _log_StirlingNegativePowers_(var, precision):
@@ -344,22 +307,7 @@ class AsymptoticExpansionGenerators(SageObject):
             sage: _.parent()
             Asymptotic Ring <m^ZZ> over Rational Field
         """
-        from .asymptotic_ring import AsymptoticRing
-        from sage.rings.rational_field import QQ
-
-        A = AsymptoticRing(growth_group='{n}^ZZ'.format(n=var),
-                           coefficient_ring=QQ)
-        if precision < 0:
-            return A.zero()
-        n = A.gen()
-
-        from sage.arith.misc import bernoulli
-        from sage.arith.srange import srange
-
-        result = sum((bernoulli(k) / k / (k-1) / n**(k-1)
-                      for k in srange(2, 2*precision + 2, 2)),
-                     A.zero())
-        return result + (1 / n**(2*precision + 1)).O()
+        return _log_Stirling_negative_powers_(var, precision)
 
     @staticmethod
     def HarmonicNumber(var, precision=None, skip_constant_summand=False):
@@ -424,13 +372,11 @@ class AsymptoticExpansionGenerators(SageObject):
             log(m) + euler_gamma + 1/2*m^(-1) - 1/12*m^(-2) + 1/120*m^(-4) + O(m^(-6))
         """
         if not skip_constant_summand:
-            from sage.symbolic.ring import SR
             coefficient_ring = SR.subring(no_variables=True)
         else:
             from sage.rings.rational_field import QQ
             coefficient_ring = QQ
 
-        from .asymptotic_ring import AsymptoticRing
         A = AsymptoticRing(growth_group='{n}^ZZ * log({n})^ZZ'.format(n=var),
                            coefficient_ring=coefficient_ring)
         n = A.gen()
@@ -448,9 +394,7 @@ class AsymptoticExpansionGenerators(SageObject):
         if precision >= 3:
             result += 1 / (2 * n)
 
-        from sage.arith.srange import srange
-        from sage.arith.misc import bernoulli
-        for k in srange(2, 2*precision - 4, 2):
+        for k in range(2, 2*precision - 4, 2):
             result += -bernoulli(k) / k / n**k
 
         if precision < 1:
@@ -552,39 +496,17 @@ class AsymptoticExpansionGenerators(SageObject):
             1/sqrt(pi)*4^n*n^(-1/2) - 1/8/sqrt(pi)*4^n*n^(-3/2) + ... + O(4^n*n^(-7/2))
             sage: set_series_precision(20)  # restore series precision default
         """
-        from sage.symbolic.ring import SR
         SCR = SR.subring(no_variables=True)
         try:
             SCR.coerce(k)
         except TypeError as e:
-            from .misc import combine_exceptions
             raise combine_exceptions(
                 TypeError('Cannot use k={}.'.format(k)), e)
 
         if precision is None:
             precision = series_precision()
 
-        S = AsymptoticExpansionGenerators._log_StirlingNegativePowers_(
-                var, precision=max(precision - 2,0))
-        n = S.parent().gen()
-        result = (S.subs(n=k*n) - S.subs(n=(k-1)*n) - S).exp()
-
-        from sage.rings.rational_field import QQ
-
-        P = S.parent().change_parameter(
-                growth_group='(QQ_+)^{n} * {n}^QQ'.format(n=var),
-                coefficient_ring=QQ)
-        n = P.gen()
-
-        b = k**k / (k-1)**(k-1)
-        if b.parent() is SR:
-            b = SCR(b).canonicalize_radical()
-        result *= n.rpow(b)
-        result *= n**(-QQ((1, 2)))
-        if not skip_constant_factor:
-            result *= (k/((k-1)*2*SCR('pi'))).sqrt()
-
-        return result
+        return _Binomial_kn_over_n_(var, k, precision, skip_constant_factor)
 
     @staticmethod
     def SingularityAnalysis(var, zeta=1, alpha=0, beta=0, delta=0,
@@ -889,7 +811,6 @@ class AsymptoticExpansionGenerators(SageObject):
             Asymptotic Ring <n^ZZ * log(n)^ZZ * Signs^n> over Symbolic Constants Subring
         """
         from itertools import islice, count
-        from .asymptotic_ring import AsymptoticRing
         from .growth_group import ExponentialGrowthGroup, \
                 MonomialGrowthGroup, GenericNonGrowthGroup
         from sage.arith.misc import falling_factorial
@@ -898,9 +819,7 @@ class AsymptoticExpansionGenerators(SageObject):
         from sage.functions.gamma import gamma
         from sage.calculus.calculus import limit
         from sage.misc.cachefunc import cached_function
-        from sage.arith.srange import srange
         from sage.rings.integer_ring import ZZ
-        from sage.symbolic.ring import SR
 
         SCR = SR.subring(no_variables=True)
         s = SR.var('s')
@@ -1133,11 +1052,8 @@ class AsymptoticExpansionGenerators(SageObject):
             ...
             ValueError: fundamental constant tau could not be determined
         """
-        from sage.symbolic.ring import SR
         from sage.rings.rational_field import QQ
         from sage.rings.integer_ring import ZZ
-        from sage.rings.asymptotic.asymptotic_ring import AsymptoticRing
-        from sage.arith.srange import srange
         y, u = SR.var('y'), SR.var('u')
         one_half = QQ((1, 2))
 
@@ -1409,7 +1325,6 @@ def _fundamental_constant_implicit_function_(phi):
         sage: _fundamental_constant_implicit_function_(phi=lambda u: 1 + 2*u + 2*u^2)
         1/2*sqrt(2)
     """
-    from sage.symbolic.ring import SR
     u = SR.var('u')
     positive_solution = [s for s in (phi(u) - u*phi(u).diff(u)).solve(u)
                          if s.rhs() > 0]
@@ -1473,6 +1388,410 @@ def _sa_coefficients_lambda_(K, beta=0):
             for k, c in enumerate(L.list())}
 
 
+@cached_function
+def _asymptotic_ring_(growth_group, coefficient_ring):
+    r"""
+    Return the asymptotic ring with the given growth group (as a string)
+    and coefficient ring.
+
+    INPUT:
+
+    - ``growth_group`` -- string describing the growth group
+
+    - ``coefficient_ring`` -- a ring
+
+    OUTPUT: an asymptotic ring
+
+    Asymptotic rings are unique parents, but constructing one from a
+    string reparses the growth group description each time; caching the
+    construction here makes repeated calls of the generators cheap.
+
+    TESTS::
+
+        sage: from sage.rings.asymptotic.asymptotic_expansion_generators \
+        ....:     import _asymptotic_ring_
+        sage: _asymptotic_ring_('n^ZZ', QQ)
+        Asymptotic Ring <n^ZZ> over Rational Field
+        sage: _asymptotic_ring_('n^ZZ', QQ) is _asymptotic_ring_('n^ZZ', QQ)
+        True
+    """
+    return AsymptoticRing(growth_group=growth_group,
+                          coefficient_ring=coefficient_ring)
+
+
+@cached_function
+def _bernoulli_even_table_(m):
+    r"""
+    Return the Bernoulli numbers `B_2, B_4, \ldots, B_{2m}` as a tuple.
+
+    INPUT:
+
+    - ``m`` -- nonnegative integer
+
+    OUTPUT: a tuple of rational numbers
+
+    The numbers are computed in one batch via PARI's ``bernvec``, which
+    exploits that a contiguous range is wanted, instead of ``m``
+    independent calls of :func:`~sage.arith.misc.bernoulli`; the table
+    is cached across calls.
+
+    TESTS::
+
+        sage: from sage.rings.asymptotic.asymptotic_expansion_generators \
+        ....:     import _bernoulli_even_table_
+        sage: _bernoulli_even_table_(4)
+        (1/6, -1/30, 1/42, -1/30)
+        sage: _bernoulli_even_table_(0)
+        ()
+    """
+    from sage.libs.pari import pari
+    from sage.rings.rational_field import QQ
+    return tuple(QQ(b) for b in pari.bernvec(m)[1:])
+
+
+@cached_function
+def _Stirling_(var, precision, skip_constant_factor):
+    r"""
+    Helper function for :meth:`AsymptoticExpansionGenerators.Stirling`
+    which caches the computed expansions.
+
+    INPUT:
+
+    - ``var`` -- string for the variable name
+
+    - ``precision`` -- integer `\ge 3`
+
+    - ``skip_constant_factor`` -- boolean
+
+    OUTPUT: an asymptotic expansion
+
+    TESTS::
+
+        sage: from sage.rings.asymptotic.asymptotic_expansion_generators \
+        ....:     import _Stirling_
+        sage: _Stirling_('n', 5, False)
+        sqrt(2)*sqrt(pi)*e^(n*log(n))*(e^n)^(-1)*n^(1/2) +
+        1/12*sqrt(2)*sqrt(pi)*e^(n*log(n))*(e^n)^(-1)*n^(-1/2) +
+        1/288*sqrt(2)*sqrt(pi)*e^(n*log(n))*(e^n)^(-1)*n^(-3/2) +
+        O(e^(n*log(n))*(e^n)^(-1)*n^(-5/2))
+
+    The result is cached; a second call does not recompute
+    the expansion::
+
+        sage: _Stirling_('n', 5, False) is _Stirling_('n', 5, False)
+        True
+    """
+    log_Stirling = _log_Stirling_(var, precision, True)
+
+    P = _asymptotic_ring_(
+        '(e^({n}*log({n})))^QQ * (e^{n})^QQ * {n}^QQ * log({n})^QQ'.format(n=var),
+        log_Stirling.parent().coefficient_ring)
+    result = exp(P(log_Stirling))
+
+    if not skip_constant_factor:
+        SCR = SR.subring(no_variables=True)
+        result *= (2*SCR('pi')).sqrt()
+
+    return result
+
+
+@cached_function
+def _log_Stirling_(var, precision, skip_constant_summand):
+    r"""
+    Helper function for :meth:`AsymptoticExpansionGenerators.log_Stirling`
+    which caches the computed expansions.
+
+    INPUT:
+
+    - ``var`` -- string for the variable name
+
+    - ``precision`` -- integer
+
+    - ``skip_constant_summand`` -- boolean
+
+    OUTPUT: an asymptotic expansion
+
+    TESTS::
+
+        sage: from sage.rings.asymptotic.asymptotic_expansion_generators \
+        ....:     import _log_Stirling_
+        sage: _log_Stirling_('n', 7, False)
+        n*log(n) - n + 1/2*log(n) + 1/2*log(2*pi) + 1/12*n^(-1)
+        - 1/360*n^(-3) + 1/1260*n^(-5) + O(n^(-7))
+
+    The result is cached; a second call does not recompute
+    the expansion::
+
+        sage: _log_Stirling_('n', 7, False) is _log_Stirling_('n', 7, False)
+        True
+    """
+    if not skip_constant_summand:
+        coefficient_ring = SR.subring(no_variables=True)
+    else:
+        from sage.rings.rational_field import QQ
+        coefficient_ring = QQ
+
+    A = _asymptotic_ring_('{n}^ZZ * log({n})^ZZ'.format(n=var),
+                          coefficient_ring)
+    n = A.gen()
+
+    log = A.locals()['log']
+    result = A.zero()
+    if precision >= 1:
+        result += n * log(n)
+    if precision >= 2:
+        result += -n
+    if precision >= 3:
+        result += log(n) / 2
+    if precision >= 4 and not skip_constant_summand:
+        result += log(2*coefficient_ring('pi')) / 2
+
+    if precision >= 4:
+        # for smaller precision the tail is zero; do not even build
+        # the helper's asymptotic ring
+        result += _log_Stirling_negative_powers_(var, precision - 4)
+
+    if precision < 1:
+        result += (n * log(n)).O()
+    elif precision == 1:
+        result += n.O()
+    elif precision == 2:
+        result += log(n).O()
+    elif precision == 3:
+        result += A(1).O()
+
+    return result
+
+
+@cached_function
+def _log_Stirling_negative_powers_(var, precision):
+    r"""
+    Helper function for
+    :meth:`AsymptoticExpansionGenerators._log_StirlingNegativePowers_`
+    which caches the computed expansions.
+
+    INPUT:
+
+    - ``var`` -- string for the variable name
+
+    - ``precision`` -- integer specifying the number of exact summands;
+      if this is negative, then the result is `0`
+
+    OUTPUT: an asymptotic expansion
+
+    TESTS::
+
+        sage: from sage.rings.asymptotic.asymptotic_expansion_generators \
+        ....:     import _log_Stirling_negative_powers_
+        sage: _log_Stirling_negative_powers_('m', 3)
+        1/12*m^(-1) - 1/360*m^(-3) + 1/1260*m^(-5) + O(m^(-7))
+
+    The result is cached; a second call does not recompute
+    the expansion::
+
+        sage: _log_Stirling_negative_powers_('m', 3) \
+        ....:     is _log_Stirling_negative_powers_('m', 3)
+        True
+    """
+    from sage.rings.rational_field import QQ
+
+    A = _asymptotic_ring_('{n}^ZZ'.format(n=var), QQ)
+    if precision < 0:
+        return A.zero()
+
+
+    # Build all summands first and construct the expansion in one go;
+    # this avoids the term-wise normalization of a sum of expansions.
+    g = A.growth_group.gen()
+    exact = A.term_monoid('exact')
+    terms = [exact(g**(1 - 2*j), coefficient=B / (2*j * (2*j - 1)))
+             for j, B in enumerate(_bernoulli_even_table_(precision),
+                                   start=1)]
+    terms.append(A.term_monoid('O')(g**(-2*precision - 1)))
+    return A(terms, convert=False)
+
+
+def _binomial_log_series_(var, k, precision):
+    r"""
+    Return the series `S(kn) - S((k-1)n) - S(n)`, where `S(n)` denotes
+    the series of negative powers of the logarithm of Stirling's
+    approximation formula.
+
+    INPUT:
+
+    - ``var`` -- string for the variable name
+
+    - ``k`` -- a number or symbolic constant
+
+    - ``precision`` -- integer specifying the number of exact summands
+
+    OUTPUT: an asymptotic expansion
+
+    This is a helper function for
+    :meth:`AsymptoticExpansionGenerators.Binomial_kn_over_n`. Substituting
+    `n \mapsto cn` in a summand `B_{2j}/(2j(2j-1)) \cdot n^{-(2j-1)}`
+    rescales its coefficient by `c^{-(2j-1)}`, so the combined series is
+    computed directly on the coefficients instead of substituting into
+    :func:`_log_Stirling_negative_powers_` three times.
+
+    TESTS::
+
+        sage: from sage.rings.asymptotic.asymptotic_expansion_generators \
+        ....:     import _binomial_log_series_
+        sage: _binomial_log_series_('n', 2, 2)
+        -1/8*n^(-1) + 1/192*n^(-3) + O(n^(-5))
+        sage: _binomial_log_series_('n', 2, 0)
+        O(n^(-1))
+
+    This coincides with the substituted series::
+
+        sage: S = asymptotic_expansions._log_StirlingNegativePowers_('n', 2)
+        sage: n = S.parent().gen()
+        sage: S.subs(n=2*n) - S.subs(n=n) - S == _binomial_log_series_('n', 2, 2)
+        True
+    """
+    from sage.rings.rational_field import QQ
+
+    A = _asymptotic_ring_('{n}^ZZ'.format(n=var), QQ)
+    n = A.gen()
+
+    result = sum((B / (2*j * (2*j - 1))
+                  * (k**(1 - 2*j) - (k-1)**(1 - 2*j) - 1) * n**(1 - 2*j)
+                  for j, B in enumerate(_bernoulli_even_table_(precision),
+                                        start=1)),
+                 A.zero())
+    return result + (1 / n**(2*precision + 1)).O()
+
+
+@cached_function
+def _Binomial_kn_over_n_(var, k, precision, skip_constant_factor):
+    r"""
+    Helper function for
+    :meth:`AsymptoticExpansionGenerators.Binomial_kn_over_n`
+    which caches the computed expansions.
+
+    INPUT:
+
+    - ``var`` -- string for the variable name
+
+    - ``k`` -- a number or symbolic constant
+
+    - ``precision`` -- integer
+
+    - ``skip_constant_factor`` -- boolean
+
+    OUTPUT: an asymptotic expansion
+
+    TESTS::
+
+        sage: from sage.rings.asymptotic.asymptotic_expansion_generators \
+        ....:     import _Binomial_kn_over_n_
+        sage: _Binomial_kn_over_n_('n', 7/5, 3, False)
+        1/2*sqrt(7)/sqrt(pi)*(7/10*7^(2/5)*2^(3/5))^n*n^(-1/2)
+        - 13/112*sqrt(7)/sqrt(pi)*(7/10*7^(2/5)*2^(3/5))^n*n^(-3/2)
+        + 169/12544*sqrt(7)/sqrt(pi)*(7/10*7^(2/5)*2^(3/5))^n*n^(-5/2)
+        + O((7/10*7^(2/5)*2^(3/5))^n*n^(-7/2))
+
+    The result is cached; a second call does not recompute
+    the expansion::
+
+        sage: _Binomial_kn_over_n_('n', 7/5, 3, False) \
+        ....:     is _Binomial_kn_over_n_('n', 7/5, 3, False)
+        True
+    """
+    from sage.rings.integer_ring import ZZ
+    if k in ZZ and k >= 2:
+        return _binomial_kn_over_n_integer_(
+            var, ZZ(k), precision, skip_constant_factor)
+
+    SCR = SR.subring(no_variables=True)
+
+    result = _binomial_log_series_(
+        var, k, precision=max(precision - 2, 0)).exp()
+
+    from sage.rings.rational_field import QQ
+
+    P = _asymptotic_ring_('(QQ_+)^{n} * {n}^QQ'.format(n=var), QQ)
+    n = P.gen()
+
+    b = k**k / (k-1)**(k-1)
+    if b.parent() is SR:
+        b = SCR(b).canonicalize_radical()
+    result *= n.rpow(b)
+    result *= n**(-QQ((1, 2)))
+    if not skip_constant_factor:
+        result *= (k/((k-1)*2*SCR('pi'))).sqrt()
+
+    return result
+
+
+def _binomial_kn_over_n_integer_(var, k, precision, skip_constant_factor):
+    r"""
+    Fast path of :meth:`AsymptoticExpansionGenerators.Binomial_kn_over_n`
+    for integral `k \ge 2`.
+
+    INPUT:
+
+    - ``var`` -- string for the variable name
+
+    - ``k`` -- an integer `\ge 2`
+
+    - ``precision`` -- integer
+
+    - ``skip_constant_factor`` -- boolean
+
+    OUTPUT: an asymptotic expansion
+
+    For integral `k` both the series coefficients and the base
+    `k^k/(k-1)^{k-1}` of the exponential growth factor are rational, so
+    the series `\exp(S(kn) - S((k-1)n) - S(n))` is computed in a power
+    series ring over `\QQ` and only the optional constant factor
+    `\sqrt{k/(2\pi(k-1))}` involves symbolic arithmetic.
+
+    TESTS::
+
+        sage: from sage.rings.asymptotic.asymptotic_expansion_generators \
+        ....:     import _binomial_kn_over_n_integer_
+        sage: _binomial_kn_over_n_integer_('n', 2, 3, False)
+        1/sqrt(pi)*4^n*n^(-1/2)
+        - 1/8/sqrt(pi)*4^n*n^(-3/2)
+        + 1/128/sqrt(pi)*4^n*n^(-5/2)
+        + O(4^n*n^(-7/2))
+        sage: _binomial_kn_over_n_integer_('n', 5, 3, True)
+        (3125/256)^n*n^(-1/2)
+        - 7/80*(3125/256)^n*n^(-3/2)
+        + 49/12800*(3125/256)^n*n^(-5/2)
+        + O((3125/256)^n*n^(-7/2))
+    """
+    from sage.rings.power_series_ring import PowerSeriesRing
+    from sage.rings.rational_field import QQ
+
+    p = max(precision - 2, 0)
+    R = PowerSeriesRing(QQ, 't', default_prec=2*p + 1)
+    t = R.gen()
+    series = sum((B / (2*j * (2*j - 1))
+                  * (k**(1 - 2*j) - (k-1)**(1 - 2*j) - 1) * t**(2*j - 1)
+                  for j, B in enumerate(_bernoulli_even_table_(p), start=1)),
+                 R.zero())
+    expseries = series.exp(prec=2*p + 1)
+
+    P = _asymptotic_ring_('(QQ_+)^{n} * {n}^QQ'.format(n=var), QQ)
+    n = P.gen()
+
+    result = sum((c * n**(-i)
+                  for i, c in enumerate(expseries.list()) if c),
+                 P.zero())
+    result += (n**(-2*p - 1)).O()
+
+    result *= n.rpow(k**k / (k-1)**(k-1))
+    result *= n**(-QQ((1, 2)))
+    if not skip_constant_factor:
+        SCR = SR.subring(no_variables=True)
+        result *= (k/((k-1)*2*SCR('pi'))).sqrt()
+
+    return result
+
+
 # Easy access to the asymptotic expansions generators from the command line:
 asymptotic_expansions = AsymptoticExpansionGenerators()
 r"""
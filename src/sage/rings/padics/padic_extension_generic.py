@@ -28,7 +28,6 @@ from sage.rings.number_field.number_field_base import NumberField
 from sage.rings.rational_field import QQ
 from sage.rings.infinity import Infinity
 from sage.structure.richcmp import op_EQ
-from functools import reduce
 from sage.categories.morphism import Morphism
 from sage.categories.map import Map
 from sage.categories.sets_with_partial_maps import SetsWithPartialMaps
@@ -39,8 +38,12 @@ from sage.categories.fields import Fields
 from sage.categories.homset import Hom
 from sage.misc.flatten import flatten
 from sage.misc.cachefunc import cached_method
+from sage.misc.lazy_import import lazy_import
 from sage.structure.richcmp import rich_to_bool
 
+lazy_import('sage.categories.pushout',
+            ['AlgebraicExtensionFunctor', 'FractionField'])
+
 
 class pAdicExtensionGeneric(pAdicGeneric):
     def __init__(self, poly, prec, print_mode, names, element_class):
@@ -57,14 +60,20 @@ class pAdicExtensionGeneric(pAdicGeneric):
         #type checking done in factory
         self._given_poly = poly
         R = poly.base_ring()
+        self._ground_ring = R
+        self._polynomial_ring = poly.parent()
         # We'll deal with the different names better later.
         # Using a tuple here is mostly needed for more general extensions
         # (ie not eisenstein or unramified)
-        print_mode['unram_name'] = names[2]
-        print_mode['ram_name'] = names[3]
-        print_mode['var_name'] = names[0]
+        print_mode.update(unram_name=names[2], ram_name=names[3],
+                          var_name=names[0])
         names = names[0]
         pAdicGeneric.__init__(self, R, R.prime(), prec, print_mode, names, element_class)
+        # A cheap fingerprint of the exact defining polynomial (set by the
+        # subclass before this constructor runs).  Comparing fingerprints
+        # first short-circuits most of the expensive polynomial comparisons
+        # triggered by the coercion machinery.
+        self._exact_modulus_fingerprint = tuple(self._exact_modulus.list())
         self._populate_coercion_lists_(coerce_list=[R])
 
     def _coerce_map_from_(self, R):
@@ -215,20 +224,27 @@ class pAdicExtensionGeneric(pAdicGeneric):
             sage: R(OK.gen(1))
             a + O(5^20)
         """
+        # constant-time answers on the hot coercion path
+        if R is self:
+            return True
+        if R is self.base_ring():
+            return True
         cat = None
         if self._implementation == 'NTL' and R == QQ:
             # Want to use DefaultConvertMap_unique
             return None
-        if isinstance(R, pAdicExtensionGeneric) and R.prime() == self.prime() and R.defining_polynomial(exact=True) == self.defining_polynomial(exact=True):
+        if (isinstance(R, pAdicExtensionGeneric) and R.prime() == self.prime()
+                and R._exact_modulus_fingerprint == self._exact_modulus_fingerprint
+                and R.defining_polynomial(exact=True) == self.defining_polynomial(exact=True)):
             if R.is_field() and not self.is_field():
                 cat = SetsWithPartialMaps()
             elif R.category() is self.category():
                 cat = R.category()
             else:
                 cat = EuclideanDomains() & MetricSpaces().Complete()
-        elif isinstance(R, sage.rings.abc.Order) and R.number_field().defining_polynomial() == self.defining_polynomial():
+        elif isinstance(R, sage.rings.abc.Order) and R.number_field().defining_polynomial() == self._exact_modulus:
             cat = IntegralDomains()
-        elif isinstance(R, NumberField) and R.defining_polynomial() == self.defining_polynomial():
+        elif isinstance(R, NumberField) and R.defining_polynomial() == self._exact_modulus:
             if self.is_field():
                 cat = Fields()
             else:
@@ -261,12 +277,16 @@ class pAdicExtensionGeneric(pAdicGeneric):
             sage: R is S
             True
         """
+        if self is other:
+            return True
         if not isinstance(other, pAdicExtensionGeneric):
             return False
 
-        return (self.ground_ring() == other.ground_ring() and
+        # cheapest comparisons first; the polynomial equality is by far
+        # the most expensive check
+        return (self.precision_cap() == other.precision_cap() and
+                self.ground_ring() == other.ground_ring() and
                 self.defining_polynomial() == other.defining_polynomial() and
-                self.precision_cap() == other.precision_cap() and
                 self._printer.richcmp_modes(other._printer, op_EQ))
 
     def __ne__(self, other):
@@ -296,9 +316,17 @@ class pAdicExtensionGeneric(pAdicGeneric):
             sage: hash(R) == hash(S)
             True
         """
-        # _printer is not hashable, hence not taken into account
-        return hash((self.ground_ring(), self.defining_polynomial(exact=True),
-                     self.precision_cap()))
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        # _printer is not hashable, hence not taken into account; the
+        # coefficient fingerprint stands in for the exact defining
+        # polynomial, whose hash is much more expensive to compute
+        h = self._hash = hash((self.ground_ring(),
+                               self._exact_modulus_fingerprint,
+                               self.precision_cap()))
+        return h
 
     #def absolute_discriminant(self):
     #    raise NotImplementedError
@@ -351,6 +379,7 @@ class pAdicExtensionGeneric(pAdicGeneric):
         else:
             return ans.change_variable_name(var)
 
+    @cached_method
     def exact_field(self):
         r"""
         Return a number field with the same defining polynomial.
@@ -358,6 +387,9 @@ class pAdicExtensionGeneric(pAdicGeneric):
         Note that this method always returns a field, even for a `p`-adic
         ring.
 
+        The result is cached, since constructing the number field is
+        expensive and pushout code asks for it repeatedly.
+
         EXAMPLES::
 
             sage: R = Zp(5,5)
@@ -441,13 +473,17 @@ class pAdicExtensionGeneric(pAdicGeneric):
             sage: W.ground_ring()
             5-adic Ring with capped relative precision 5
         """
-        return self._given_poly.base_ring()
+        return self._ground_ring
 
+    @cached_method
     def ground_ring_of_tower(self):
         """
         Return the `p`-adic base ring of which this is ultimately an
         extension.
 
+        The result is cached, since coercion and printing code call this
+        repeatedly and each call would otherwise walk the whole tower.
+
         Currently this function is identical to ``ground_ring()``, since
         relative extensions have not yet been implemented.
 
@@ -473,7 +509,7 @@ class pAdicExtensionGeneric(pAdicGeneric):
             sage: Qq(27,30,names='a').polynomial_ring()
             Univariate Polynomial Ring in x over 3-adic Field with capped relative precision 30
         """
-        return self._given_poly.parent()
+        return self._polynomial_ring
 
     #def teichmuller(self, x, prec = None):
     #    if prec is None:
@@ -491,6 +527,7 @@ class pAdicExtensionGeneric(pAdicGeneric):
     #        xnew = x - x*delta*(1-q*delta)
     #    return x
 
+    @cached_method
     def construction(self, forbid_frac_field=False):
         """
         Return the functorial construction of this ring, namely,
@@ -500,6 +537,9 @@ class pAdicExtensionGeneric(pAdicGeneric):
         Also preserves other information that makes this ring unique
         (e.g. precision, rounding, print mode).
 
+        The result is cached, since the pushout machinery calls this
+        method repeatedly during coercion discovery.
+
         INPUT:
 
         - ``forbid_frac_field`` -- require a completion functor rather
@@ -533,14 +573,13 @@ class pAdicExtensionGeneric(pAdicGeneric):
             sage: c(R) is K
             True
         """
-        from sage.categories.pushout import AlgebraicExtensionFunctor as AEF, FractionField as FF
         if not forbid_frac_field and self.is_field():
-            return (FF(), self.integer_ring())
-        return (AEF([self.defining_polynomial(exact=True)],
-                    [self.variable_name()],
-                    precs=[self.precision_cap()],
-                    print_mode=self._printer.dict(),
-                    implementations=[self._implementation]),
+            return (FractionField(), self.integer_ring())
+        return (AlgebraicExtensionFunctor([self.defining_polynomial(exact=True)],
+                                          [self.variable_name()],
+                                          precs=[self.precision_cap()],
+                                          print_mode=self._printer.dict(),
+                                          implementations=[self._implementation]),
                 self.base_ring())
 
     #def hasGNB(self):
@@ -563,10 +602,12 @@ class pAdicExtensionGeneric(pAdicGeneric):
             sage: W.random_element().parent() is W
             True
         """
-        return reduce(lambda x,y: x+y,
-                      [self.ground_ring().random_element() * self.gen()**i for i in
-                           range(self.modulus().degree())],
-                      0)
+        g = self.gen()
+        gr = self.ground_ring()
+        result = self.zero()
+        for _ in range(self.modulus().degree()):
+            result = result * g + gr.random_element()
+        return result
 
     @cached_method(key=(lambda self, base, basis, map: (base or self.base_ring(), map)))
     def free_module(self, base=None, basis=None, map=True):
@@ -930,14 +971,22 @@ class DefPolyConversion(Morphism):
         """
         S = self.codomain()
         Sbase = S.base_ring()
-        L = x.polynomial().list()
+        try:
+            # p-adic extension elements expose their coefficient list
+            # directly; this skips building a Polynomial wrapper that
+            # would immediately be torn apart again
+            L = x._polynomial_list()
+        except AttributeError:
+            L = x.polynomial().list()
         while L and L[-1].is_zero():
             del L[-1]
+        if Sbase is not x.parent().base_ring():
+            L = [Sbase(c) for c in L]
         if isinstance(x.parent(), pAdicExtensionGeneric):
             absprec = x.precision_absolute()
             if absprec is not Infinity:
-                return S([Sbase(c).lift_to_precision() for c in L], absprec)
-        return S([Sbase(c) for c in L])
+                return S([c.lift_to_precision() for c in L], absprec)
+        return S(L)
 
     def _call_with_args(self, x, args=(), kwds={}):
         """
@@ -972,9 +1021,14 @@ class DefPolyConversion(Morphism):
         """
         S = self.codomain()
         Sbase = S.base_ring()
-        L = x.polynomial().list()
+        try:
+            L = x._polynomial_list()
+        except AttributeError:
+            L = x.polynomial().list()
         while L and L[-1].is_zero():
             del L[-1]
+        if Sbase is not x.parent().base_ring():
+            L = [Sbase(c) for c in L]
         if isinstance(x.parent(), pAdicExtensionGeneric):
             if args:
                 if 'absprec' in kwds:
@@ -985,5 +1039,5 @@ class DefPolyConversion(Morphism):
                 absprec = kwds.pop('absprec', Infinity)
             absprec = min(absprec, x.precision_absolute())
             if absprec is not Infinity:
-                return S([Sbase(c).lift_to_precision() for c in L], absprec, *args, **kwds)
-        return S([Sbase(c) for c in L], *args, **kwds)
+                return S([c.lift_to_precision() for c in L], absprec, *args, **kwds)
+        return S(L, *args, **kwds)
@@ -121,11 +121,12 @@ class pAdicGeneric(LocalGeneric):
             print_mode = {}
         elif isinstance(print_mode, str):
             print_mode = {'mode': print_mode}
+        printer_defaults = self._printer.dict()
         for option in ['mode', 'pos', 'ram_name', 'unram_name', 'var_name',
                        'max_ram_terms', 'max_unram_terms', 'max_terse_terms',
                        'sep', 'alphabet', 'show_prec']:
             if option not in print_mode:
-                print_mode[option] = self._printer.dict()[option]
+                print_mode[option] = printer_defaults[option]
         return print_mode
 
     def ngens(self):
@@ -642,6 +643,7 @@ class pAdicGeneric(LocalGeneric):
         else:
             if not isinstance(print_mode, dict):
                 print_mode = dict(print_mode)
+            printer_defaults = self._printer.dict()
             for option in ['mode', 'pos', 'max_ram_terms', 'max_unram_terms', 'max_terse_terms', 'sep', 'alphabet']:
                 if option in print_mode:
                     print_mode["print_" + option] = print_mode[option]
@@ -650,13 +652,13 @@ class pAdicGeneric(LocalGeneric):
                     if "print_" + option in kwds:
                         print_mode["print_" + option] = kwds["print_" + option]
                     else:
-                        print_mode["print_" + option] = self._printer.dict()[option]
+                        print_mode["print_" + option] = printer_defaults[option]
             for option in ['ram_name', 'unram_name', 'var_name']:
                 if option not in print_mode:
                     if option in kwds:
                         print_mode[option] = kwds[option]
                     else:
-                        print_mode[option] = self._printer.dict()[option]
+                        print_mode[option] = printer_defaults[option]
         return ExtensionFactory(base=self, modulus=modulus, prec=prec, names=names, check=True, implementation=implementation, **print_mode)
 
     def _is_valid_homomorphism_(self, codomain, im_gens, base_map=None):
@@ -1905,7 +1907,8 @@ def local_print_mode(obj, print_options, pos=None, ram_name=None):
         print_options['pos'] = pos
     if ram_name is not None:
         print_options['ram_name'] = ram_name
+    printer_defaults = obj._printer.dict()
     for option in ['mode', 'pos', 'ram_name', 'unram_name', 'var_name', 'max_ram_terms', 'max_unram_terms', 'max_terse_terms', 'sep', 'alphabet']:
         if option not in print_options:
-            print_options[option] = obj._printer.dict()[option]
+            print_options[option] = printer_defaults[option]
     return pAdicPrinter(obj, print_options)
@@ -25,10 +25,22 @@ REFERENCES:
 #                  https://www.gnu.org/licenses/
 # ****************************************************************************
 
-from sage.structure.sage_object import SageObject
+from sage.ext.fast_callable import fast_callable
+from sage.misc.cachefunc import cached_method
+from sage.misc.lazy_import import lazy_import
 from sage.rings.infinity import infinity
+from sage.rings.real_double import RDF
+from sage.sets.real_set import RealSet
+from sage.structure.sage_object import SageObject
 from sage.structure.unique_representation import UniqueRepresentation
 
+lazy_import('sage.geometry.polyhedron.constructor', 'Polyhedron')
+lazy_import('sage.plot.colors', 'rainbow')
+lazy_import('sage.plot.graphics', 'Graphics')
+lazy_import('sage.plot.line', 'line')
+lazy_import('sage.plot.plot', 'plot')
+lazy_import('sage.plot.text', 'text')
+
 
 class TropicalVariety(UniqueRepresentation, SageObject):
     r"""
@@ -183,11 +195,6 @@ class TropicalVariety(UniqueRepresentation, SageObject):
             ...
             ValueError: x + y is not a multivariate tropical polynomial
         """
-        import operator
-        from itertools import combinations
-        from sage.symbolic.ring import SR
-        from sage.symbolic.relation import solve
-        from sage.arith.misc import gcd
         from sage.rings.semirings.tropical_mpolynomial import TropicalMPolynomial
 
         if not isinstance(poly, TropicalMPolynomial):
@@ -195,19 +202,41 @@ class TropicalVariety(UniqueRepresentation, SageObject):
 
         self._poly = poly
         self._hypersurface = []
+        self._keys = []
+        pd = poly.dict()
+        if len(pd) <= 1:
+            # a single term is affine everywhere, so the corner locus is
+            # empty; skip the symbolic machinery (and its imports) entirely
+            self._vars = []
+            return
+
+        import operator
+        from itertools import combinations
+        from sage.symbolic.ring import SR
+        from sage.symbolic.relation import solve
+        from sage.arith.misc import gcd
+
         tropical_roots = []
         variables = [SR.var(name)
                      for name in poly.parent().variable_names()]
 
         # Convert each term to its linear function
         linear_eq = {}
-        pd = poly.dict()
+        constants = {key: val.lift() for key, val in pd.items()}
         for key in pd:
             eq = sum(variables[i] * e for i, e in enumerate(key))
-            eq += pd[key].lift()
+            eq += constants[key]
             linear_eq[key] = eq
         temp_keys = []
         temp_order = []
+        use_min = poly.parent().base()._use_min
+
+        # Terms that tend to dominate are compared first, so pairs that
+        # do not contribute a component are rejected after fewer solve()
+        # calls; the collected conditions are re-emitted in dictionary
+        # order below to keep the final system unchanged
+        score = {key: constants[key] + sum(key) for key in pd}
+        compare_order = sorted(pd, key=score.__getitem__, reverse=not use_min)
 
         # Checking for all possible combinations of two terms
         for keys in combinations(pd, 2):
@@ -218,35 +247,47 @@ class TropicalVariety(UniqueRepresentation, SageObject):
             xy_interval = []
             xy_interval.append(tuple(final_sol))
 
-            # Comparing with other terms
-            min_max = linear_eq[keys[0]]
-            for i, v in enumerate(variables):
-                min_max = min_max.subs(**{str(v): final_sol[i]})
-            all_sol_compare = []
+            # Comparing with other terms; the value of a term on the
+            # solution set is obtained by evaluating its affine form at
+            # ``final_sol`` directly, which is much cheaper than chained
+            # symbolic substitutions
+            min_max = sum(e * final_sol[i] for i, e in enumerate(keys[0]))
+            min_max += constants[keys[0]]
+            sol_by_compare = {}
             no_solution = False
-            for compare in pd:
+            for compare in compare_order:
                 if compare not in keys:
-                    temp_compare = linear_eq[compare]
-                    for i, v in enumerate(variables):
-                        temp_compare = temp_compare.subs(**{str(v): final_sol[i]})
-                    if min_max == temp_compare:
+                    temp_compare = sum(e * final_sol[i]
+                                       for i, e in enumerate(compare))
+                    temp_compare += constants[compare]
+                    difference = min_max - temp_compare
+                    if not difference:
                         sol_compare = [[]]
-                    elif poly.parent().base()._use_min:
+                    elif not difference.variables() and (
+                            difference > 0 if use_min else difference < 0):
+                        # on the solution set the two affine forms differ
+                        # by a constant, with ``compare`` always the better
+                        # one; reject the pair without calling solve()
+                        no_solution = True
+                        break
+                    elif use_min:
                         sol_compare = solve(min_max < temp_compare, variables)
                     else:
                         sol_compare = solve(min_max > temp_compare, variables)
                     if sol_compare:
                         if isinstance(sol_compare[0], list):
                             if sol_compare[0]:
-                                all_sol_compare.append(sol_compare[0][0])
+                                sol_by_compare[compare] = sol_compare[0][0]
                         else:  # solution is unbounded on one side
-                            all_sol_compare.append(sol_compare[0])
+                            sol_by_compare[compare] = sol_compare[0]
                     else:
                         no_solution = True
                         break
 
             # Solve the condition for parameter
             if not no_solution:
+                all_sol_compare = [sol_by_compare[k] for k in pd
+                                   if k in sol_by_compare]
                 parameter = set()
                 for sol in all_sol_compare:
                     parameter = parameter.union(set(sol.variables()))
@@ -262,7 +303,6 @@ class TropicalVariety(UniqueRepresentation, SageObject):
                     temp_keys.append(keys)
 
         # Changing all the operator symbol to be <= or >=
-        self._keys = []
         components = []
         dim_param = 0
         if tropical_roots:
@@ -280,8 +320,7 @@ class TropicalVariety(UniqueRepresentation, SageObject):
                         index_vars += 1
                 new_eq.append(eq.subs(subs_dict))
             new_eq = tuple(new_eq)
-            arg.remove(arg[0])
-            arg.insert(0, new_eq)
+            arg[0] = new_eq
             if not arg[1] or not isinstance(arg[1], list):
                 arg[1] = []
                 for var in vars:
@@ -290,10 +329,8 @@ class TropicalVariety(UniqueRepresentation, SageObject):
                     arg[1].append(expr1)
                     arg[1].append(expr2)
             else:
-                params = arg[1]
-                arg.remove(params)
                 new_param = []
-                for param in params:
+                for param in arg[1]:
                     lhs = param.lhs().subs(subs_dict)
                     rhs = param.rhs().subs(subs_dict)
                     if param.operator() == operator.gt:
@@ -301,22 +338,29 @@ class TropicalVariety(UniqueRepresentation, SageObject):
                     else:
                         expr = lhs <= rhs
                     new_param.append(expr)
-                arg.insert(1, new_param)
+                arg[1] = new_param
             components.append(arg)
 
-        # Determine the order of each component
+        # Determine the order of each component; duplicates are detected
+        # through a hashable signature of the component instead of a
+        # quadratic scan with symbolic equality tests.  Equal components
+        # are produced in identical canonical form, so their string
+        # representations coincide.
         self._vars = vars
         final_order = []
+        seen = {}
         for i, component in enumerate(components):
-            if component not in self._hypersurface:
+            signature = (tuple(str(eq) for eq in component[0]),
+                         tuple(str(cond) for cond in component[1]))
+            index = seen.get(signature)
+            if index is None:
+                seen[signature] = len(self._hypersurface)
                 self._hypersurface.append(component)
                 final_order.append(temp_order[i])
                 self._keys.append(temp_keys[i])
-            else:
-                index = self._hypersurface.index(component)
-                if temp_order[i] > final_order[index]:
-                    final_order[index] = temp_order[i]
-                    self._keys[index] = temp_keys[i]
+            elif temp_order[i] > final_order[index]:
+                final_order[index] = temp_order[i]
+                self._keys[index] = temp_keys[i]
         for i in range(len(self._hypersurface)):
             self._hypersurface[i].append(final_order[i])
 
@@ -620,9 +664,29 @@ class TropicalSurface(TropicalVariety):
                 temp_u.add(0)
             if not temp_v:
                 temp_v.add(0)
+            v1, v2 = self._vars
             for expr in list_expr:
+                diff = expr.lhs() - expr.rhs()
+                if diff.is_polynomial(v1) and diff.is_polynomial(v2):
+                    # affine constraint a*t1 + b*t2 + c: the bound that
+                    # solve() would return follows by rearranging, with
+                    # no Maxima call
+                    a = diff.coefficient(v1)
+                    b = diff.coefficient(v2)
+                    c = diff.subs(**{str(v1): 0, str(v2): 0})
+                    for u in temp_u:
+                        if b:
+                            temp_v.add(-(a*u + c) / b)
+                        else:
+                            temp_v.add(0)
+                    for v in temp_v:
+                        if a:
+                            temp_u.add(-(b*v + c) / a)
+                        else:
+                            temp_u.add(0)
+                    continue
                 for u in temp_u:
-                    sol = solve(expr.subs(**{str(self._vars[0]): u}), self._vars[1])
+                    sol = solve(expr.subs(**{str(v1): u}), v2)
                     if not sol:
                         temp_v.add(0)
                     elif not sol[0]:
@@ -630,7 +694,7 @@ class TropicalSurface(TropicalVariety):
                     else:
                         temp_v.add(sol[0][0].rhs())
                 for v in temp_v:
-                    sol = solve(expr.subs(**{str(self._vars[1]): v}), self._vars[0])
+                    sol = solve(expr.subs(**{str(v2): v}), v1)
                     if not sol:
                         temp_u.add(0)
                     elif not sol[0]:
@@ -649,16 +713,16 @@ class TropicalSurface(TropicalVariety):
         v_range = srange(axes[1][0], axes[1][1]+dv, dv)
         zmin, zmax = None, None
         for comp in self._hypersurface:
+            # compile the constraints and the z-coordinate once per
+            # component; evaluating the compiled forms at every grid
+            # point is much cheaper than symbolic substitution
+            constraints = [(fast_callable(exp.lhs() - exp.rhs(), vars=self._vars),
+                            exp.operator()) for exp in comp[1]]
+            z_func = fast_callable(comp[0][2], vars=self._vars)
             for u in u_range:
                 for v in v_range:
-                    checkpoint = True
-                    for exp in comp[1]:
-                        final_exp = exp.subs(**{str(self._vars[0]): u, str(self._vars[1]): v})
-                        if not final_exp:
-                            checkpoint = False
-                            break
-                    if checkpoint:
-                        z = comp[0][2].subs(**{str(self._vars[0]): u, str(self._vars[1]): v})
+                    if all(op(f(u, v), 0) for f, op in constraints):
+                        z = z_func(u, v)
                         if (zmin is None) and (zmax is None):
                             zmin = z
                             zmax = z
@@ -704,7 +768,6 @@ class TropicalSurface(TropicalVariety):
             7: {(-1/2, -1, -1), (-1/2, 2, -1), (0, 0, 0), (0, 2, 0)},
             8: {(1, 1, 1), (1, 2, 1), (2, 1, 1), (2, 2, 1)}}
         """
-        from sage.sets.real_set import RealSet
         from sage.symbolic.relation import solve
         from sage.rings.rational_field import QQ
 
@@ -807,8 +870,10 @@ class TropicalSurface(TropicalVariety):
 
         - ``color`` -- string or tuple that represent a color (default:
           ``random``); ``random`` means each polygon will be assigned
-          a different color. If instead a specific ``color`` is provided,
-          then all polygon will be given the same color.
+          a different color, chosen deterministically from a rainbow of
+          ``self.number_of_components()`` colors. If instead a specific
+          ``color`` is provided, then all polygon will be given the same
+          color.
 
         OUTPUT: Graphics3d Object
 
@@ -849,15 +914,8 @@ class TropicalSurface(TropicalVariety):
             p2 = x**2 + x + y + z + R(1)
             sphinx_plot(p2.tropical_variety().plot())
         """
-        from random import random
-        from sage.plot.graphics import Graphics
-        from sage.geometry.polyhedron.constructor import Polyhedron
-
         if color == 'random':
-            colors = []
-            for _ in range(self.number_of_components()):
-                color = (random(), random(), random())
-                colors.append(color)
+            colors = rainbow(self.number_of_components())
         elif isinstance(color, str):
             colors = [color] * self.number_of_components()
         else:
@@ -905,12 +963,14 @@ class TropicalCurve(TropicalVariety):
         sage: tv.components()
         [[(t1, t1), [t1 >= 0], 1], [(0, t1), [t1 <= 0], 1], [(t1, 0), [t1 <= 0], 1]]
     """
+    @cached_method
     def _axes(self):
         """
         Set the default axes for ``self``.
 
         This default axes is used for plot of tropical curve and also the
-        3d plot of tropical polynomial function. The axes is chosen by first
+        3d plot of tropical polynomial function. The result is cached, so
+        repeated plots do not recompute it. The axes is chosen by first
         find all vertices of this tropical curve. Then we choose the minimum
         and maximum of all x-component in this vertices to be the x-axis.
         The same apply to the y-axis.
@@ -948,26 +1008,20 @@ class TropicalCurve(TropicalVariety):
                         bound = max(abs(op), bound)
             return [[-bound, bound]] * 2
 
-        verts = self.vertices()
-        xmin = xmax = list(verts)[0][0]
-        for vertex in verts:
-            if vertex[0] < xmin:
-                xmin = vertex[0]
-            elif vertex[0] > xmax:
-                xmax = vertex[0]
-        ymin = ymax = list(verts)[0][1]
-        for vertex in verts:
-            if vertex[1] < ymin:
-                ymin = vertex[1]
-            elif vertex[1] > ymax:
-                ymax = vertex[1]
-        return [[xmin-1, xmax+1], [ymin-1, ymax+1]]
+        verts = list(self.vertices())
+        xs = [vertex[0] for vertex in verts]
+        ys = [vertex[1] for vertex in verts]
+        return [[min(xs)-1, max(xs)+1], [min(ys)-1, max(ys)+1]]
 
+    @cached_method
     def vertices(self):
         r"""
         Return all vertices of ``self``, which is the point where three or
         more edges intersect.
 
+        The result is cached since the hypersurface does not change
+        after construction; this also speeds up ``_axes`` and plotting.
+
         OUTPUT: A set of `(x,y)` points
 
         EXAMPLES::
@@ -985,12 +1039,11 @@ class TropicalCurve(TropicalVariety):
             return set()
 
         vertices = set()
+        bounds = self._parameter_bounds()
+        var = self._vars[0]
         for i, component in enumerate(self._hypersurface):
             parametric_function = component[0]
-            var = component[1][0].variables()[0]
-            interval = self._parameter_intervals()[i]
-            lower = interval[0].lower()
-            upper = interval[0].upper()
+            lower, upper = bounds[i]
             if lower != -infinity:
                 x = parametric_function[0].subs(**{str(var): lower})
                 y = parametric_function[1].subs(**{str(var): lower})
@@ -1001,10 +1054,14 @@ class TropicalCurve(TropicalVariety):
                 vertices.add((x, y))
         return vertices
 
+    @cached_method
     def _parameter_intervals(self):
         r"""
         Return the intervals of each component's parameter of ``self``.
 
+        The result is cached since the hypersurface does not change
+        after construction.
+
         OUTPUT: A list of ``RealSet``
 
         EXAMPLES::
@@ -1018,8 +1075,6 @@ class TropicalCurve(TropicalVariety):
             sage: p2.tropical_variety()._parameter_intervals()
             [(-oo, 0], [0, +oo), [-1, 4/3], (-oo, 0], [0, +oo)]
         """
-        from sage.sets.real_set import RealSet
-
         intervals = []
         R = self._poly.parent().base().base_ring()
         for component in self._hypersurface:
@@ -1035,6 +1090,28 @@ class TropicalCurve(TropicalVariety):
             intervals.append(interval)
         return intervals
 
+    @cached_method
+    def _parameter_bounds(self):
+        r"""
+        Return the endpoints of each component's parameter of ``self``.
+
+        This is the scalar counterpart of :meth:`_parameter_intervals`,
+        used internally by :meth:`vertices` and :meth:`plot`, which only
+        need the two endpoints and not a full ``RealSet``.
+
+        OUTPUT: A list of pairs ``(lower, upper)``
+
+        EXAMPLES::
+
+            sage: T = TropicalSemiring(QQ)
+            sage: R.<x,y> = PolynomialRing(T)
+            sage: p1 = x^2 + R(-1)*x*y + R(-1)*x + R(1/3)
+            sage: p1.tropical_variety()._parameter_bounds()
+            [(-Infinity, 0), (0, +Infinity), (-1, 4/3), (-Infinity, 0), (0, +Infinity)]
+        """
+        return [(interval[0].lower(), interval[0].upper())
+                for interval in self._parameter_intervals()]
+
     def plot(self):
         """
         Return the plot of ``self``.
@@ -1107,54 +1184,73 @@ class TropicalCurve(TropicalVariety):
             x*y**5 + R(7)*x**2 + R(5)*x*y + R(3)*y**2 + R(2)*x + y + R(10)
             sphinx_plot(p2.tropical_variety().plot())
         """
-        from sage.plot.plot import plot
-        from sage.plot.text import text
-        from sage.plot.graphics import Graphics
-        from sage.plot.plot import parametric_plot
-
         if not self._hypersurface:
-            return plot(lambda x: float('nan'), {-1, 1})
+            return plot(lambda x: float('nan'), (-1, 1))
 
-        combined_plot = Graphics()
         large_int = 100
-        intervals = self._parameter_intervals()
+        bounds = self._parameter_bounds()
+        # every component of a curve is parametrized by the same single
+        # parameter, so extract it once
+        var = self._vars[0]
+
+        # A curve consisting of one unbounded component is a straight
+        # line; two samples determine it, so skip the general loop
+        if (len(self._hypersurface) == 1 and bounds[0][0] == -infinity
+                and bounds[0][1] == infinity):
+            component = self._hypersurface[0]
+            fx = fast_callable(component[0][0], vars=[var], domain=RDF)
+            fy = fast_callable(component[0][1], vars=[var], domain=RDF)
+            combined_plot = line([(fx(-large_int), fy(-large_int)),
+                                  (fx(large_int), fy(large_int))],
+                                 color='red')
+            if component[2] > 1:
+                text_order = text(str(component[2]), (fx(0), fy(0)),
+                                  fontsize=16, color='black')
+                for primitive in text_order:
+                    combined_plot.add_primitive(primitive)
+            axes = self._axes()
+            combined_plot.set_axes_range(xmin=axes[0][0], xmax=axes[0][1],
+                                         ymin=axes[1][0], ymax=axes[1][1])
+            return combined_plot
+
+        combined_plot = Graphics()
         for i, component in enumerate(self._hypersurface):
-            var = component[1][0].variables()[0]
             parametric_function = component[0]
             order = component[2]
-            interval = intervals[i]
-            if interval[0].lower() == -infinity:
-                lower = interval[0].upper() - large_int
-                upper = interval[0].upper()
+            lower, upper = bounds[i]
+            if lower == -infinity:
+                lower = upper - large_int
                 midpoint = upper - 0.5
-            elif interval[0].upper() == infinity:
-                lower = interval[0].lower()
-                upper = interval[0].lower() + large_int
+            elif upper == infinity:
+                upper = lower + large_int
                 midpoint = lower + 0.5
             else:
-                lower = interval[0].lower()
-                upper = interval[0].upper()
                 midpoint = (lower+upper) / 2
 
+            # The component is linear in the parameter, so its two
+            # endpoints determine the segment exactly
+            fx = fast_callable(parametric_function[0], vars=[var], domain=RDF)
+            fy = fast_callable(parametric_function[1], vars=[var], domain=RDF)
             if (lower == infinity) and (upper == infinity):
                 midpoint = 0
-                plot = parametric_plot(parametric_function, (var, -large_int,
-                                       large_int), color='red')
+                t0, t1 = -large_int, large_int
             else:
-                plot = parametric_plot(parametric_function, (var, lower, upper),
-                                       color='red')
+                t0, t1 = lower, upper
+            component_plot = line([(fx(t0), fy(t0)), (fx(t1), fy(t1))],
+                                  color='red')
+
+            # Appending the primitives directly avoids rebuilding the
+            # combined object list on every Graphics addition
+            for primitive in component_plot:
+                combined_plot.add_primitive(primitive)
 
             # Add the order if it is greater than or equal to 2
             if component[2] > 1:
-                point = []
-                for eq in component[0]:
-                    value = eq.subs(**{str(var): midpoint})
-                    point.append(value)
-                text_order = text(str(order), (point[0], point[1]),
+                point = (fx(midpoint), fy(midpoint))
+                text_order = text(str(order), point,
                                   fontsize=16, color='black')
-                combined_plot += plot + text_order
-            else:
-                combined_plot += plot
+                for primitive in text_order:
+                    combined_plot.add_primitive(primitive)
 
         # Set default axes
         axes = self._axes()